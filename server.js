@@ -10,6 +10,7 @@ const jwt = require("jsonwebtoken");
 const { body, validationResult } = require("express-validator");
 const nodemailer = require("nodemailer");
 const path = require("path");
+const crypto = require("crypto");
 
 const app = express();
 app.use(cors());
@@ -83,7 +84,7 @@ const transporter = nodemailer.createTransport({
 });
 
 function generateOtp() {
-  return String(Math.floor(100000 + Math.random() * 900000));
+  return String(crypto.randomInt(100000, 1000000));
 }
 
 async function sendOtpEmail(toEmail, otp) {
@@ -197,17 +198,15 @@ app.post("/api/auth/login", async (req, res) => {
 // REQUEST RESET
 app.post("/api/auth/request-reset", async (req, res) => {
   const { email } = req.body;
-  const otp = generateOtp();
 
   try {
-    const user = await dbQuery("SELECT * FROM users1 WHERE email=$1", [email]);
-    if (user.rows.length === 0)
-      return res.status(404).json({ error: "User not found" });
-
-    await dbQuery(
+    const otp = generateOtp();
+    const updated = await dbQuery(
       "UPDATE users1 SET reset_otp=$1, reset_expires=NOW() + INTERVAL '5 minutes' WHERE email=$2",
       [otp, email]
     );
+    if (updated.rowCount === 0)
+      return res.status(404).json({ error: "User not found" });
 
     const sent = await sendOtpEmail(email, otp);
     if (!sent) return res.status(500).json({ error: "Email send failed" });